@@ -1,5 +1,22 @@
-from .backup import *
-from .cmd_handler import *
-from .preset import *
-from .destination import *
-from .progress_info import *
+from importlib import import_module
+
+from .exceptions import *
+from .exceptions import exceptions as _exceptions
+
+# the other modules are only imported once one of their names is used, so
+# importing the CLI doesn't load jsonschema and zipfile for --help.
+_lazy_imports = {
+    "Backup": ".backup",
+    "CommandHandler": ".cmd_handler",
+    "Preset": ".preset",
+    "Destination": ".destination",
+    "ProgressInfo": ".progress_info",
+}
+
+__all__ = [*_lazy_imports, *_exceptions.__all__]
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        return getattr(import_module(_lazy_imports[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
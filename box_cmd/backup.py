@@ -1,5 +1,7 @@
 import json
+import shutil
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
@@ -10,26 +12,29 @@ from .exceptions import NotABackupException, FormatException, ContentTypeExcepti
 __all__ = ["Backup"]
 
 
-def rmdir(path: Path):
-    """Recursively remove a directory and its contents.
+@lru_cache(maxsize=1024)
+def _read_zip_metafile(path: str, mtime_ns: int, size: int) -> dict | None:
+    """Read the metafile of a zip archive. Destinations are listed once per
+    target while backing up, so the result is cached by the archive's
+    modification time and size, and read again only once the archive changes.
 
     Args:
-        path (Path): The path to target.
+        path (str): The path to the zip archive.
+        mtime_ns (int): The archive's modification time.
+        size (int): The archive's size.
 
-    Raises:
-        ValueError: If the path is not a directory.
+    Returns:
+        dict | None: The parsed metafile, or None if the archive has none.
     """
-    if not path.is_dir():
-        raise ValueError(path)
-    for file in path.iterdir():
-        if file.is_file():
-            file.unlink()
-        if file.is_dir():
-            rmdir(file)
-    path.rmdir()
+    with ZipFile(path, "r") as zip_file:
+        try:
+            metafile_info = zip_file.getinfo(".box.meta")  # a dict lookup, namelist() copies every name.
+        except KeyError:
+            return None
+        return json.loads(zip_file.read(metafile_info))  # json decodes the UTF-8 bytes itself.
 
 
-@dataclass
+@dataclass(slots=True)
 class Backup:
     name: str = None
     path: Path = None
@@ -39,14 +44,12 @@ class Backup:
     date: datetime = None
     content_hash: str = None
     content_type: str = None
+    content_size: int = None
+    file_count: int = None
+    content_hash_scheme: str = None
 
     def __str__(self) -> str:
-        output = "Backup:"
-        output += f"\n\tname: {self.name}"
-        output += f"\n\ttarget: {self.target}"
-        output += f"\n\tpath: {self.path}"
-        output += f"\n\tdate: {self.date}"
-        return output
+        return f"Backup:\n\tname: {self.name}\n\ttarget: {self.target}\n\tpath: {self.path}\n\tdate: {self.date}"
 
     @staticmethod
     def extract_zip_archive(archive_path: Path, destination_path: Path):
@@ -56,8 +59,8 @@ class Backup:
             archive_path (Path): The path to the zip archive.
             destination_path (Path): The destination to extract the archive in.
         """
-        zf = ZipFile(archive_path)
-        zf.extractall(destination_path)
+        with archive_path.open("rb", buffering=1 << 17) as fp, ZipFile(fp) as zf:
+            zf.extractall(destination_path)
 
     @staticmethod
     def restore_zip_archive(backup: 'Backup', target: Path):
@@ -69,34 +72,47 @@ class Backup:
         """
         Backup.extract_zip_archive(backup.path, target)
         target.joinpath(".box.meta").unlink()
+        target.joinpath(".box.digests").unlink(missing_ok=True)  # not stored by older backups.
 
     @classmethod
-    def _load_zip(cls, file_path: Path):
+    def _load_zip(cls, file_path: Path, stem: str):
         try:
-            with ZipFile(file_path, "r") as zip_file:
-                if ".box.meta" not in zip_file.namelist():
-                    raise NotABackupException(file_path)
-                metafile = zip_file.read(".box.meta").decode("utf-8")
-                metafile = json.loads(metafile)
-
-                name_separator = metafile['name_separator']
-                date_format = metafile['date_format']
-                target = Path(metafile['target'])
-                content_hash = metafile['content_hash']
-                content_type = metafile['content_type']
-                name_str = file_path.stem.split(name_separator)[0]
-                date_str = file_path.stem.split(name_separator)[1]
-                date = datetime.strptime(date_str, date_format)
-
-                backup_path = file_path.absolute()
-                return cls(name_str, backup_path, date_format, name_separator, target, date, content_hash, content_type)
+            file_stat = file_path.stat()
+            metafile = _read_zip_metafile(str(file_path), file_stat.st_mtime_ns, file_stat.st_size)
         except BadZipFile as e:
             raise FormatException(file_path.suffix) from e
+        if metafile is None:
+            raise NotABackupException(file_path)
+
+        name_separator = metafile['name_separator']
+        date_format = metafile['date_format']
+        target = Path(metafile['target'])
+        content_hash = metafile['content_hash']
+        content_type = metafile['content_type']
+        content_size = metafile.get('content_size')  # not stored by older backups.
+        file_count = metafile.get('file_count')
+        content_hash_scheme = metafile.get('content_hash_scheme')
+        # archives are named after the target, so split on the known prefix
+        # rather than on the separator, which the target name may contain.
+        name_prefix = target.stem + name_separator
+        if stem.startswith(name_prefix):
+            name_str = target.stem
+            date_str = stem[len(name_prefix):]
+        else:  # the archive was renamed.
+            name_str, _, date_str = stem.partition(name_separator)
+        if metafile.get('date') is not None:
+            date = datetime.fromisoformat(metafile['date'])
+        else:  # older backups only have their date in the archive name.
+            date = datetime.strptime(date_str, date_format)
+
+        backup_path = file_path.absolute()
+        return cls(name_str, backup_path, date_format, name_separator, target, date, content_hash, content_type, content_size, file_count, content_hash_scheme)
 
     @classmethod
     def from_file(cls, file_path: Path):
-        if file_path.suffix == ".zip":
-            return cls._load_zip(file_path)
+        name = file_path.name  # suffix and stem would each split the name again.
+        if name.endswith(".zip") and name != ".zip":
+            return cls._load_zip(file_path, name[:-4])
         else:
             raise FormatException(file_path.suffix)
 
@@ -120,6 +136,22 @@ class Backup:
         else:
             raise ValueError(target)
 
+    def get_file_digests(self) -> dict | None:
+        """Get the digest index stored in the backup. It maps each file's
+        archive name to the size, modification time and SHA-256 digest the
+        file had when it was backed up, and records when it was hashed.
+
+        Returns:
+            dict | None: The digest index, or None if the backup has none.
+        """
+        if self.path.suffix != ".zip":
+            return None
+        try:
+            with ZipFile(self.path, "r") as zip_file:
+                return json.loads(zip_file.read(".box.digests"))
+        except (KeyError, ValueError, BadZipFile):  # missing or unreadable, it's only a cache.
+            return None
+
     def delete(self):
         self.path.unlink()
 
@@ -150,7 +182,7 @@ class Backup:
             )
         if self.content_type == "folder":
             if target.exists():
-                rmdir(target)
+                shutil.rmtree(target)
             target.mkdir()
             if (
                 self.path.suffix == ".zip"
@@ -3,21 +3,10 @@ import platform
 
 from pathlib import Path
 
-from . import CommandHandler, ProgressInfo, Backup
-from .exceptions import (
-    PresetNotFoundException,
-    TargetNotFoundException,
-    DestinationNotFoundException,
-    BackupHashException,
-    FormatException,
-    ContentTypeException,
-    TargetMatchException,
-    BackupAbortedException,
-    DestinationLoopException
-)
-
 import click
-from tqdm import tqdm
+
+# the rest of box_cmd and tqdm are imported by the commands that use them, so
+# --help and --version don't have to load them.
 
 __version__ = "2.0.3"
 
@@ -39,15 +28,11 @@ def presets(obj):
     Args:
         obj (dict): Click's context object.
     """
-    try:
+    from . import CommandHandler
+
+    try:  # only loading the config can fail, printing the presets can't.
         handler = CommandHandler(obj["config"])
-        print(f"Loading presets from {obj['config']}\n\nPresets:")
-        for preset in handler.list_presets():
-            try:
-                print("-" * os.get_terminal_size().columns)
-            except OSError:
-                print("-" * 10)
-            print(preset)
+        preset_list = handler.list_presets()
     except FileNotFoundError:
         print(f"Uh-Oh! Your config file appears to be missing: '{obj['config']}'")
     except ValueError:
@@ -63,13 +48,56 @@ def presets(obj):
         print(
             f"The path exists, but this looks like a directory. Please ensure the path is correct: {obj['config']}"
         )
+    else:
+        print(f"Loading presets from {obj['config']}\n\nPresets:")
+        try:
+            divider = "-" * os.get_terminal_size().columns
+        except OSError:
+            divider = "-" * 10
+        for preset in preset_list:
+            print(divider)
+            print(preset)
+
+
+def _print_backup_error(exception: Exception):
+    """Print the message for an exception yielded by the backup generator,
+    which yields them since it can't raise them itself.
+
+    Args:
+        exception (Exception): The yielded exception.
+
+    Raises:
+        exception: If there is no message for the exception.
+    """
+    from .exceptions import (
+        TargetNotFoundException,
+        DestinationNotFoundException,
+        BackupHashException,
+        FormatException,
+        BackupAbortedException,
+        DestinationLoopException
+    )
+
+    messages = {
+        TargetNotFoundException: "Backup Failed:\n\tTarget not found:\n\tTarget: {0.target}\n\tDestination: {0.destination}",
+        DestinationNotFoundException: "Backup Failed:\n\tDestination not found:\n\tTarget: {0.target}\n\tDestination: {0.destination}",
+        BackupHashException: "Backup Skipped:\n\tBackup hash matched latest backup in destination path.\n\tTarget: {0.target}\n\tDestination: {0.destination}",
+        FormatException: "Backup Failed:\n\tBackup format unsupported\n\tTarget: {0.target}\n\tDestination: {0.destination}",
+        BackupAbortedException: "Backup Aborted:\n\tTarget: {0.target}\n\tDestination: {0.destination}",
+        DestinationLoopException: "The destination: {0.destination} is contained within the target: {0.target}. Aborting...",
+    }
+    if type(exception) not in messages:
+        raise exception
+    print(messages[type(exception)].format(exception))
+
 
 @cli.command(help="Create a backup of a preset.")
 @click.option("--force", "-f", default=False, help="Force the creation of a backup, even if a duplicate already exists.")
 @click.option("--keep", "-k", default=False, help="Keep the backup even if it surpasses the preset's max_backup_count.")
+@click.option("--reuse-digests", "-r", default=False, help="Skip rereading files whose size and modification time match the latest backup when checking for a duplicate.")
 @click.argument("preset")
 @click.pass_obj
-def pack(obj, preset: str, force: bool, keep: bool):
+def pack(obj, preset: str, force: bool, keep: bool, reuse_digests: bool):
     """Create a backup of a preset's targets.
 
     Args:
@@ -79,19 +107,32 @@ def pack(obj, preset: str, force: bool, keep: bool):
             identical backup exists.
         keep (bool): Whether or not to keep backups beyond the
             max_backup_count.
+        reuse_digests (bool): Whether or not to trust files whose size and
+            modification time match the latest backup in the duplicate
+            check, instead of reading them again.
 
     Raises:
         backup: If a problem is found in the backup generator, the exceptions
             will be raised here.
 
     Usage:
-        `box pack <preset> [--force] [--keep]`
+        `box pack <preset> [--force] [--keep] [--reuse-digests]`
     """
-    print("Creating backups...")
+    from tqdm import tqdm
+
+    from . import CommandHandler, ProgressInfo, Backup
+    from .exceptions import PresetNotFoundException
+
     handler = CommandHandler(obj["config"])
+    try:  # looked up here, the backup generator would only raise it once iterated.
+        handler.get_preset(preset)
+    except PresetNotFoundException:
+        print(f"The requested preset '{preset}' is not found.")
+        return
+    print("Creating backups...")
     items: list[Backup, Exception] = []
     progress_bar = tqdm()
-    for item in handler.create_backups(preset, force, keep):
+    for item in handler.create_backups(preset, force, keep, reuse_digests):
         if isinstance(item, ProgressInfo):  # handle progress bar stuff
             progress_bar.update(item.count)
             if item.total is not None:
@@ -103,39 +144,12 @@ def pack(obj, preset: str, force: bool, keep: bool):
     progress_bar.close()
 
     for item in items:
-        try:
-            if isinstance(item, Exception):
-                raise item  # backup generator might yield exceptions since it can't raise them personally.
-            elif isinstance(item, Backup):
-                print(item)
-            else:
-                raise TypeError(item)
-        except PresetNotFoundException:
-            print(f"The requested preset '{obj['location']}' is not found.")
-        except TargetNotFoundException as e:
-            print(
-                f"Backup Failed:\n\tTarget not found:\n\tTarget: {e.target}\n\tDestination: {e.destination}"
-            )
-        except DestinationNotFoundException as e:
-            print(
-                f"Backup Failed:\n\tDestination not found:\n\tTarget: {e.target}\n\tDestination: {e.destination}"
-            )
-        except BackupHashException as e:
-            print(
-                f"Backup Skipped:\n\tBackup hash matched latest backup in destination path.\n\tTarget: {e.target}\n\tDestination: {e.destination}"
-            )
-        except FormatException as e:
-            print(
-                f"Backup Failed:\n\tBackup format unsupported\n\tTarget: {e.target}\n\tDestination: {e.destination}"
-            )
-        except BackupAbortedException as e:
-            print(
-                f"Backup Aborted:\n\tTarget: {e.target}\n\tDestination: {e.destination}"
-            )
-        except DestinationLoopException as e:
-            print(
-                f"The destination: {e.destination} is contained within the target: {e.target}. Aborting..."
-            )
+        if isinstance(item, Backup):
+            print(item)
+        elif isinstance(item, Exception):
+            _print_backup_error(item)
+        else:
+            raise TypeError(item)
 
 
 @cli.command(help="Restore a backup to its target or a custom destination.")
@@ -155,8 +169,17 @@ def unpack(obj, source: str, destination: str = None):
     Usage:
         `box unpack --source <source> [--destination destination]`
     """
+    from . import CommandHandler
+    from .exceptions import (
+        PresetNotFoundException,
+        FormatException,
+        ContentTypeException,
+        TargetMatchException,
+    )
+
     handler = CommandHandler(obj["config"])
-    if source not in handler.list_presets() and Path(source).exists():
+    preset_names = set(handler.list_preset_names())  # the presets themselves aren't needed.
+    if source not in preset_names and Path(source).exists():
         source = Path(source)
 
     try:
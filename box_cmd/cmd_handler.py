@@ -27,6 +27,15 @@ class CommandHandler:
         presets = Preset.get_presets()
         return presets
 
+    def list_preset_names(self) -> list[str]:
+        """Return the names of the presets in the PresetManager's config file,
+        without building the presets themselves.
+
+        Returns:
+            list[str]: The list of preset names.
+        """
+        return Preset.get_preset_names()
+
     def get_preset(self, preset_name: str) -> Preset:
         """Return a preset from the PresetManager.
 
@@ -72,7 +81,7 @@ class CommandHandler:
             return destination.get_backups()
 
     def create_backups(
-        self, preset_name: str, force: bool, keep: bool
+        self, preset_name: str, force: bool, keep: bool, reuse_digests: bool = False
     ) -> Generator[Backup | BoxException | ProgressInfo, None, None]:
         """Create backups of all targets in the preset.
         A backup is stored in each destination following any destination specific
@@ -93,6 +102,9 @@ class CommandHandler:
             force (bool): If true, the backup process will create a backup even if the
                 hash check fails.
             keep (bool): If true, the backup process will not delete old backups.
+            reuse_digests (bool, optional): If true, files whose size and
+                modification time match the latest backup aren't read again
+                for the hash check. Defaults to False.
 
         Yields:
             Backup: the backup created.
@@ -100,8 +112,7 @@ class CommandHandler:
             ProgressInfo: updates to the backup progress from the model.
         """
         preset: Preset = Preset.get_preset(preset_name)
-        for item in preset.create_backups(force=force, keep=keep):
-            yield item
+        yield from preset.create_backups(force=force, keep=keep, reuse_digests=reuse_digests)
 
     def delete_backup(self, backup_path: Path) -> None:
         """Delete a backup matching the given file path.
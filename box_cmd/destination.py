@@ -1,12 +1,17 @@
+import os
+
 from pathlib import Path
+from operator import attrgetter
 from .backup import Backup
 from .exceptions import NotABackupException, FormatException
-VALID_FILE_FORMATS = ["zip"]
+VALID_FILE_FORMATS = frozenset({"zip"})
 
 __all__ = ["Destination"]
 
 
 class Destination:
+    __slots__ = ("_path", "_date_format", "_name_separator", "_max_backup_count", "_file_format", "_compresslevel")
+
     def __init__(
         self,
         path: Path,
@@ -14,27 +19,36 @@ class Destination:
         name_separator: str = "-",
         max_backup_count: int = 3,
         file_format: str = "zip",
+        compresslevel: int = 1,
     ):
         self.path: Path = path
         self.date_format: str = date_format
         self.name_separator: str = name_separator  # separates the original file name from the date in the archive name
         self.max_backup_count: int = max_backup_count
         self.file_format: str = file_format
+        self.compresslevel: int = compresslevel
+
+    def _key(self) -> tuple:
+        """The values that make two destinations equal, read straight from
+        the slots rather than through the properties."""
+        return (
+            self._path,
+            self._date_format,
+            self._name_separator,
+            self._max_backup_count,
+            self._file_format,
+            self._compresslevel,
+        )
 
     def __eq__(self, other_destination) -> bool:
-        if isinstance(other_destination, Destination):
-            if self.path != other_destination.path:
-                return False
-            if self.date_format != other_destination.date_format:
-                return False
-            if self.name_separator != other_destination.name_separator:
-                return False
-            if self.max_backup_count != other_destination.max_backup_count:
-                return False
-            if self.file_format != other_destination.file_format:
-                return False
-            return True
-        return False
+        if not isinstance(other_destination, Destination):
+            return NotImplemented
+        return self._key() == other_destination._key()
+
+    def __hash__(self) -> int:
+        # hashes what __eq__ compares, so don't change a destination while
+        # it's in a set or used as a dict key.
+        return hash(self._key())
 
     def __str__(self) -> str:
         return str(self.path)
@@ -161,18 +175,50 @@ class Destination:
         else:
             self._file_format = new_file_format
 
+    @property
+    def compresslevel(self) -> int:
+        """The deflate compression level for new archives, from 0 (no
+        compression) to 9 (smallest archives). Defaults to 1, compressing is
+        most of the work of a backup and higher levels are a lot slower for
+        little gain.
+
+        Returns:
+            int: The compression level.
+        """
+        return self._compresslevel
+
+    @compresslevel.setter
+    def compresslevel(self, new_compresslevel: int):
+        """The deflate compression level for new archives, from 0 (no
+        compression) to 9 (smallest archives).
+
+        Args:
+            new_compresslevel (int): The potential new value for the
+                compresslevel.
+
+        Raises:
+            TypeError: If the new_compresslevel is not an integer.
+            ValueError: If the new_compresslevel is not between 0 and 9.
+        """
+        if not isinstance(new_compresslevel, int):
+            raise TypeError(new_compresslevel)
+        elif not 0 <= new_compresslevel <= 9:
+            raise ValueError(new_compresslevel)
+        else:
+            self._compresslevel = new_compresslevel
+
     @classmethod
     def from_dict(cls, destination_dict: dict):
-        destination = cls(path=Path(destination_dict["path"]))
-        if "date_format" in destination_dict:
-            destination.date_format = destination_dict["date_format"]
-        if "name_separator" in destination_dict:
-            destination.name_separator = destination_dict["name_separator"]
-        if "max_backup_count" in destination_dict:
-            destination.max_backup_count = destination_dict["max_backup_count"]
-        if "file_format" in destination_dict:
-            destination.file_format = destination_dict["file_format"]
-        return destination
+        # passed to the constructor so each value is validated once, rather
+        # than setting the defaults and then overwriting them.
+        options = {
+            key: destination_dict[key]
+            for key in (
+                "date_format", "name_separator", "max_backup_count", "file_format", "compresslevel"
+            )
+            if key in destination_dict
+        }
+        return cls(path=Path(destination_dict["path"]), **options)
 
     def get_backups(self, target: Path = None) -> list[Backup]:
         """Get all backups found in the destination, optionally filtered by a source target.
@@ -190,7 +236,18 @@ class Destination:
         """
         backups: list[Backup] = []
         if self.file_format == "zip":
-            for path in self.path.glob("*.zip"):
+            # scandir gets each entry's type from the directory listing itself,
+            # so there's no extra stat per file to skip non-archives.
+            try:
+                with os.scandir(self.path) as entries:
+                    paths = [
+                        Path(entry.path)
+                        for entry in entries
+                        if entry.name.endswith(".zip") and entry.is_file()
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
+                return backups  # a missing destination holds no backups.
+            for path in paths:
                 try:
                     backup = Backup.from_file(path)
                     if target is not None and backup.target == target:
@@ -201,7 +258,7 @@ class Destination:
                     continue
         else:
             raise FormatException(self.file_format)
-        backups.sort(key=lambda x: x.date)
+        backups.sort(key=attrgetter("date"))
         return backups
 
     def get_latest_backup(
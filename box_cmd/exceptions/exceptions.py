@@ -1,12 +1,31 @@
 from pathlib import Path
 
+__all__ = [
+    "BoxException",
+    "NotABackupException",
+    "PresetException",
+    "ContentTypeException",
+    "BackupException",
+    "DestinationLoopException",
+    "BackupAbortedException",
+    "PresetNotFoundException",
+    "InvalidPresetConfig",
+    "FormatException",
+    "BackupHashException",
+    "DestinationNotFoundException",
+    "TargetNotFoundException",
+    "TargetMatchException",
+]
+
 
 class BoxException(Exception):
     def __init__(self, msg) -> None:
         super().__init__(msg)
-        self.message = msg
 
-    pass
+    @property
+    def message(self):
+        """The message the exception was created with, stored in args."""
+        return self.args[0]
 
 
 class NotABackupException(BoxException):
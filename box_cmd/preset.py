@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import os
 import json
+import time
 import hashlib
 
 from pathlib import Path
 from datetime import datetime
 from itertools import product
+from operator import attrgetter
+from stat import S_ISDIR, S_ISREG
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator
 from zipfile import ZipFile, ZIP_DEFLATED
 
@@ -14,33 +19,179 @@ from .backup import Backup
 from .progress_info import ProgressInfo
 from .exceptions import BackupAbortedException, BackupHashException, BoxException, PresetNotFoundException, TargetNotFoundException, DestinationNotFoundException, DestinationLoopException, FormatException, InvalidPresetConfig
 
-from jsonschema import validate, ValidationError
+from jsonschema import Draft6Validator, ValidationError
 
 __all__ = ["Preset"]
 
+# files modified this close to when they were hashed may have changed in the
+# same timestamp tick, so their cached digests aren't trusted. FAT is the
+# coarsest common case, storing modification times to the nearest 2 seconds.
+MTIME_GRANULARITY_NS = 2_000_000_000
 
-def count_files(path: Path, files_only=False):
-    if not path.is_dir():
-        raise ValueError(path)
-    count = 0
-    for _ in path.glob("**/*"):
-        if files_only and _.is_file():
-            count += 1
-        elif not files_only:
-            count += 1
-    return count
+# stored with each content hash, hashes made another way can't be compared.
+CONTENT_HASH_SCHEME = "sha256-sorted-names"
+
+# zipping reports progress once per this many entries rather than per entry,
+# small files otherwise spend more time on progress updates than on zipping.
+PROGRESS_BATCH_SIZE = 64
+
+
+def walk(path: Path) -> Generator[os.DirEntry, None, None]:
+    """Recursively iterate over the contents of a directory. Uses os.scandir,
+    which gets each entry's type from the directory listing instead of
+    calling stat on every path. Symlinked directories are yielded but not
+    walked into.
+
+    Args:
+        path (Path): The directory to walk.
+
+    Yields:
+        os.DirEntry: Every file and directory found.
+    """
+    directories = [path]
+    while directories:
+        with os.scandir(directories.pop()) as entries:
+            for entry in entries:
+                yield entry
+                if entry.is_dir(follow_symlinks=False):
+                    directories.append(entry.path)
+
+
+def update_hash(content_hash, path: Path | str, chunk_size: int = 1 << 20):
+    """Feed the contents of a file into a hash object in fixed-size chunks,
+    keeping memory use constant regardless of the file size.
+
+    Args:
+        content_hash: The hashlib object to update.
+        path (Path): The file to read.
+        chunk_size (int, optional): The amount of bytes to read at a time.
+            Defaults to 1 MiB.
+    """
+    with open(path, "rb") as fp:
+        while chunk := fp.read(chunk_size):
+            content_hash.update(chunk)
+
+
+def hash_file(path: Path | str) -> bytes:
+    """Get the SHA-256 digest of a file's contents.
+
+    Args:
+        path (Path | str): The file to hash.
+
+    Returns:
+        bytes: The digest of the file.
+    """
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+, reads into a single reused buffer.
+        with open(path, "rb") as fp:
+            return hashlib.file_digest(fp, "sha256").digest()
+    file_hash = hashlib.sha256()
+    update_hash(file_hash, path)
+    return file_hash.digest()
+
+
+def hash_files(paths: list[Path | str]) -> list[bytes]:
+    """Get the SHA-256 digests of a batch of files, in order.
+
+    Args:
+        paths (list[Path | str]): The files to hash.
+
+    Returns:
+        list[bytes]: The digest of each file.
+    """
+    return [hash_file(path) for path in paths]
+
+
+def get_content_stats(target: Path) -> tuple[int, int]:
+    """Get the total size in bytes and the number of the files contained in a
+    target path. Both only need a stat of each file, so they're a cheap way
+    to tell that a target's contents changed.
+
+    Args:
+        target (Path): The target path.
+
+    Raises:
+        ValueError: If the target path is not a file or directory, or does
+            not exist.
+
+    Returns:
+        tuple[int, int]: The total size of the target's files, and the
+            number of files.
+    """
+    try:
+        target_stat = target.stat()  # a single stat tells us both if and what the target is.
+    except (FileNotFoundError, NotADirectoryError):
+        raise ValueError(target) from None
+    if S_ISDIR(target_stat.st_mode):
+        content_size = 0
+        file_count = 0
+        for entry in walk(target):
+            if entry.is_file():
+                content_size += entry.stat().st_size
+                file_count += 1
+        return content_size, file_count
+    elif S_ISREG(target_stat.st_mode):
+        return target_stat.st_size, 1
+    else:
+        raise ValueError(target)
+
+
+def combine_digests(files: dict[str, list]) -> str:
+    """Combine the digests of a target's files into its content hash. Files
+    are taken in order of their names, and each name is hashed along with
+    its digest, so the hash doesn't depend on the order the directory lists
+    them in and renaming a file changes it.
+
+    Args:
+        files (dict[str, list]): The digest index's files, mapping each
+            file's archive name to its size, modification time and hex
+            digest.
+
+    Returns:
+        str: The hex digest of the target's contents.
+    """
+    content_hash = hashlib.sha256()
+    for arcname in sorted(files):
+        content_hash.update(arcname.encode("utf-8", "surrogateescape"))
+        content_hash.update(b"\0")  # names can't contain a null byte, so this can't be ambiguous.
+        content_hash.update(bytes.fromhex(files[arcname][2]))
+    return content_hash.hexdigest()
+
+
+def zip_write(
+    zip_file: ZipFile, path: Path | str, arcname: str, hash_contents: bool = False
+) -> bytes | None:
+    """Write a file into a zip archive through ZipFile.write, which uses the
+    archive's compression level. If hash_contents is True, the file is
+    hashed just before it is written, so it is read twice. The second read
+    usually comes from the page cache.
+
+    Args:
+        zip_file (ZipFile): The archive to write to.
+        path (Path | str): The file to add to the archive.
+        arcname (str): The name of the file inside the archive.
+        hash_contents (bool, optional): Whether to hash the file's
+            contents. Defaults to False.
+
+    Returns:
+        bytes | None: The digest of the file, if it was hashed.
+    """
+    file_digest = hash_file(path) if hash_contents else None
+    zip_file.write(path, arcname)
+    return file_digest
 
 
 class Preset:
     """Main preset class"""
+    __slots__ = ("_name", "_targets", "_destinations")
+
     def __init__(self, name: str):
         self._targets: list[Path] = []
         self._destinations: list[Destination] = []
         self.name = name
 
     @staticmethod
-    def load_file(config_file: Path) -> list[Preset]:
-        return _preset_container.load(config_file)
+    def load_file(config_file: Path) -> None:
+        _preset_container.load(config_file)
 
     @staticmethod
     def get_preset(name: str) -> Preset:
@@ -49,30 +200,40 @@ class Preset:
     def get_presets() -> list[Preset]:
         return _preset_container.presets
 
+    @staticmethod
+    def get_preset_names() -> list[str]:
+        return _preset_container.preset_names
+
     def __str__(self) -> str:
-        output = self.name
-        output += "\n\tTargets:"
-        for target in self._targets:
-            output += f"\n\t\t- {target}"
-        output += "\n\tDestinations:"
+        lines = [self.name, "\tTargets:"]
+        lines.extend(f"\t\t- {target}" for target in self._targets)
+        lines.append("\tDestinations:")
+        now = datetime.now()  # one timestamp shared by every date format preview.
         for destination in self._destinations:
-            output += f"\n\t\t- {destination.path}"
-            output += f"\n\t\t\tFile Format: {destination.file_format}"
-            output += f"\n\t\t\tMax Backup Count: {destination.max_backup_count}"
-            output += f"\n\t\t\tDate Format: {destination.date_format} [{datetime.strftime(datetime.now(), destination.date_format)}]"
-            output += f"\n\t\t\tName Separator: {destination.name_separator}"
-        return output
+            lines += (
+                f"\t\t- {destination.path}",
+                f"\t\t\tFile Format: {destination.file_format}",
+                f"\t\t\tMax Backup Count: {destination.max_backup_count}",
+                f"\t\t\tDate Format: {destination.date_format} [{now.strftime(destination.date_format)}]",
+                f"\t\t\tName Separator: {destination.name_separator}",
+                f"\t\t\tCompression Level: {destination.compresslevel}",
+            )
+        return "\n".join(lines)
 
     def __eq__(self, other_preset) -> bool:
-        if isinstance(other_preset, Preset):
-            if self._destinations != other_preset._destinations:
-                return False
-            if self._targets != other_preset._targets:
-                return False
-            if self.name != other_preset.name:
-                return False
-            return True
-        return False
+        if not isinstance(other_preset, Preset):
+            return NotImplemented
+        # cheapest first, most presets differ by name.
+        return (
+            self.name == other_preset.name
+            and self._targets == other_preset._targets
+            and self._destinations == other_preset._destinations
+        )
+
+    def __hash__(self) -> int:
+        # equal presets share a name, and the name is what identifies a preset in
+        # the config, so it's all that's hashed.
+        return hash(self.name)
 
     def __repr__(self):
         return f"Preset(name={self.name}, _targets={self._targets}, _destinations={self._destinations})"
@@ -167,6 +328,9 @@ class Preset:
         target: Path,
         destination: Destination,
         content_hash: str,
+        content_size: int = None,
+        file_count: int = None,
+        date: datetime = None,
     ) -> str:
         """Create the metafile of a backup. Stores the backup's target source,
         the name_separator, the date_format, and the content_hash. All of this
@@ -181,6 +345,12 @@ class Preset:
             destination (Destination): The destination path.
                 Used to fetch metadata.
             content_hash (str): The hash of the backup's contents.
+            content_size (int, optional): The total size of the backup's
+                contents. Defaults to None.
+            file_count (int, optional): The number of files in the backup.
+                Defaults to None.
+            date (datetime, optional): The date of the backup, as it's
+                written in the archive name. Defaults to None.
 
         Returns:
             str: The contents of the metafile.
@@ -190,7 +360,11 @@ class Preset:
             "name_separator": destination.name_separator,
             "date_format": destination.date_format,
             "content_hash": content_hash,
+            "content_hash_scheme": CONTENT_HASH_SCHEME,
             "content_type": Backup.get_content_type(target),
+            "content_size": content_size,
+            "file_count": file_count,
+            "date": date.isoformat() if date is not None else None,
         }
         return json.dumps(metadata, indent=4)
 
@@ -199,16 +373,38 @@ class Preset:
         archive_name: str,
         target: Path,
         destination: Destination,
-        metafile_str: str,
+        content_hash: str = None,
+        content_size: int = None,
+        file_count: int = None,
+        file_digests: dict = None,
+        date: datetime = None,
+        store_digests: bool = False,
     ) -> Generator[Path | ProgressInfo, None, None]:
         """Handle the creation of a zip archive from the target path to the
         destination.
 
+        If no content_hash is given, it is computed from the target's files
+        as they are written to the archive, along with the digest index
+        that can be stored next to the metafile.
+
         Args:
             archive_name (str): The name of the archive to be created.
                 Excluding the suffix.
             target (Path): The target path.
             destination (Destination): The destination to store the archive.
+            content_hash (str, optional): The hash of the target's contents.
+                Defaults to None.
+            content_size (int, optional): The total size of the target's
+                contents. Defaults to None.
+            file_count (int, optional): The number of files in the target.
+                Defaults to None.
+            file_digests (dict, optional): The digest index made alongside
+                the content_hash. Defaults to None.
+            date (datetime, optional): The date of the backup, stored in the
+                metafile. Defaults to None.
+            store_digests (bool, optional): Whether to store the digest index
+                in the archive, for later duplicate checks to reuse.
+                Defaults to False.
 
         Raises:
             ValueError: If the target path is not a file or directory.
@@ -217,53 +413,155 @@ class Preset:
             Path: The path of the newly created archive.
         """
         archive_path = destination.path.joinpath(archive_name + ".zip")
+        hash_contents = content_hash is None
+        if hash_contents:
+            file_digests = {"hashed_at": time.time_ns(), "files": {}}
         try:
-            with ZipFile(archive_path, mode="w", compression=ZIP_DEFLATED) as zip_file:
-                if target.is_dir():
-                    file_count = (
-                        count_files(target) + 1
-                    )  # adding one for the .box.meta
-                    yield ProgressInfo(0, msg=f"Zipping {target}", total=file_count)
-                    for item in target.glob("**/*"):
-                        yield ProgressInfo(
-                            msg=f"Zipping {target.name} | {item.relative_to(target)}"
-                        )
-                        zip_file.write(item, item.relative_to(target))
-                elif target.is_file():
-                    file_count = 2
-                    yield ProgressInfo(0, msg=f"Zipping {target}", total=file_count)
-                    zip_file.write(target, target.relative_to(target.parent))
-                    yield ProgressInfo(msg=f"Zipping {target}")
-                else:
-                    raise ValueError(target)
-                zip_file.writestr(".box.meta", metafile_str)
-                yield ProgressInfo(msg="Zipping .box.meta")
+            with archive_path.open("wb", buffering=1 << 15) as fp:
+                with ZipFile(
+                    fp, mode="w", compression=ZIP_DEFLATED,
+                    compresslevel=destination.compresslevel,
+                ) as zip_file:
+                    if target.is_dir():
+                        entries = list(walk(target))  # walked once, for the total and the zipping.
+                        progress_total = len(entries) + 1  # adding one for the .box.meta
+                        yield ProgressInfo(0, msg=f"Zipping {target}", total=progress_total)
+                        zipped = 0  # entries zipped since the last progress update.
+                        for entry in entries:
+                            arcname = os.path.relpath(entry.path, target)
+                            if zipped == PROGRESS_BATCH_SIZE:
+                                yield ProgressInfo(zipped, msg=f"Zipping {target.name} | {arcname}")
+                                zipped = 0
+                            if entry.is_dir():
+                                zip_file.write(entry.path, arcname)
+                            elif not hash_contents:
+                                zip_write(zip_file, entry.path, arcname)
+                            else:
+                                # stat before reading, a change while zipping then misses the cache.
+                                file_stat = entry.stat()
+                                file_digest = zip_write(zip_file, entry.path, arcname, hash_contents)
+                                file_digests["files"][arcname] = [
+                                    file_stat.st_size, file_stat.st_mtime_ns, file_digest.hex()
+                                ]
+                            zipped += 1
+                        if zipped:
+                            yield ProgressInfo(zipped, msg=f"Zipping {target.name}")
+                    elif target.is_file():
+                        progress_total = 2
+                        yield ProgressInfo(0, msg=f"Zipping {target}", total=progress_total)
+                        if not hash_contents:
+                            zip_write(zip_file, target, target.name)
+                        else:
+                            file_stat = target.stat()
+                            file_digest = zip_write(zip_file, target, target.name, hash_contents)
+                            file_digests["files"][target.name] = [
+                                file_stat.st_size, file_stat.st_mtime_ns, file_digest.hex()
+                            ]
+                        yield ProgressInfo(msg=f"Zipping {target}")
+                    else:
+                        raise ValueError(target)
+                    if hash_contents:
+                        content_hash = combine_digests(file_digests["files"])
+                    metafile_str = self._create_metafile(
+                        target, destination, content_hash, content_size, file_count, date
+                    )
+                    zip_file.writestr(".box.meta", metafile_str)
+                    if store_digests and file_digests is not None:
+                        zip_file.writestr(".box.digests", json.dumps(file_digests))
+                    yield ProgressInfo(msg="Zipping .box.meta")
+                # make sure the archive is on disk before old backups get rotated out.
+                fp.flush()
+                os.fsync(fp.fileno())
         finally:
             yield archive_path
 
-    def create_md5_hash(
-        self, target: Path
-    ) -> Generator[ProgressInfo | str, None, None]:
-        md5_hash = hashlib.md5()
+    def create_content_hash(
+        self, target: Path, known_digests: dict = None
+    ) -> Generator[ProgressInfo | dict | str, None, None]:
+        """Hash the contents of the target with SHA-256. The hash is only
+        used to detect duplicate backups; SHA-256 is used over MD5 as OpenSSL
+        hardware accelerates it on most modern CPUs.
+
+        Each file is hashed separately across a thread pool, hashlib releases
+        the GIL while hashing, and the file digests are combined into the
+        content hash by combine_digests. Files are handed to the pool in
+        batches so small files don't each pay for a task of their own.
+
+        If a digest index from an earlier backup is given, files whose size
+        and modification time still match it reuse the recorded digest
+        instead of being read again, unless they were modified too close to
+        when they were hashed to tell apart. A file rewritten with contents
+        of the same size and its modification time restored is then missed,
+        so the index should only be given when that trade-off is wanted.
+
+        Args:
+            target (Path): The target to hash.
+            known_digests (dict, optional): The digest index of an earlier
+                backup of the target. Defaults to None.
+
+        Raises:
+            ValueError: If the target path is not a file or directory.
+
+        Yields:
+            ProgressInfo: Contains file progress on the hash creation.
+            dict: The digest index of the target's files.
+            str: The hex digest of the target's contents, yielded last.
+        """
+        hashed_at = time.time_ns()  # taken before any file is stat'ed.
         if target.is_dir():
-            file_count = count_files(target, files_only=True)
-            yield ProgressInfo(count=0, msg="Checking MD5 Hash", total=file_count)
-            for item in target.glob("**/*"):
-                if item.is_dir():  # can't read bytes of a folder.
-                    continue
-                md5_hash.update(item.read_bytes())
-                yield ProgressInfo(msg="Checking MD5 Hash")
+            entries = [entry for entry in walk(target) if entry.is_file()]
+            arcnames = [os.path.relpath(entry.path, target) for entry in entries]
         elif target.is_file():
-            md5_hash.update(target.read_bytes())
-            yield ProgressInfo(count=1, msg="Checking MD5 Hash", total=1)
+            entries = [target]
+            arcnames = [target.name]
         else:
             raise ValueError(target)
-        yield md5_hash.hexdigest()
+        known_files = {}
+        trusted_before = 0
+        if known_digests is not None:
+            known_files = known_digests.get("files", {})
+            trusted_before = known_digests.get("hashed_at", 0) - MTIME_GRANULARITY_NS
+        files = {}
+        file_digests: list[bytes | None] = []
+        for entry, arcname in zip(entries, arcnames):
+            file_stat = entry.stat()
+            files[arcname] = [file_stat.st_size, file_stat.st_mtime_ns, None]
+            known = known_files.get(arcname)
+            if (
+                known is not None
+                and known[:2] == files[arcname][:2]
+                and file_stat.st_mtime_ns < trusted_before
+            ):
+                file_digests.append(bytes.fromhex(known[2]))
+            else:
+                file_digests.append(None)
+        stale = [i for i, file_digest in enumerate(file_digests) if file_digest is None]
+        yield ProgressInfo(count=0, msg="Checking content hash", total=len(entries))
+        if len(stale) < len(entries):  # sent on its own, setting the total resets the count.
+            yield ProgressInfo(len(entries) - len(stale), msg="Checking content hash")
+        if stale:
+            workers = min(32, (os.cpu_count() or 1) + 4)  # ThreadPoolExecutor's default
+            # keep a few batches per worker so large files still spread out.
+            batch_size = min(32, max(1, len(stale) // (workers * 4)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batches = [
+                    stale[i:i + batch_size] for i in range(0, len(stale), batch_size)
+                ]
+                paths = [[entries[i] for i in batch] for batch in batches]
+                for batch, batch_digests in zip(batches, executor.map(hash_files, paths)):
+                    for i, file_digest in zip(batch, batch_digests):
+                        file_digests[i] = file_digest
+                    yield ProgressInfo(len(batch), msg="Checking content hash")
+        for arcname, file_digest in zip(arcnames, file_digests):
+            files[arcname][2] = file_digest.hex()
+        yield {"hashed_at": hashed_at, "files": files}
+        yield combine_digests(files)
 
     def create_backups(
         self,
         force=False,
         keep=False,
+        reuse_digests=False,
     ) -> Generator[Backup | BoxException | ProgressInfo, None, None]:
         """Trigger backup creation of all available targets in a preset to all
         available destinations in a preset. Automatically rotates backups to
@@ -276,10 +574,17 @@ class Preset:
         If `keep` is set to True, the backup rotation will
         be disabled, allowing you to store backups beyond the max_backup_count.
 
+        If `reuse_digests` is set to True, the duplicate check reuses the
+        file digests stored with the latest backup for files whose size and
+        modification time haven't changed, instead of reading them again.
+        New backups then store their file digests for the next run.
+
         Args:
             force (bool, optional): Disable content hash checking and allow
                 duplicate backups. Defaults to False.
             keep (bool, optional): Disable backup rotation. Defaults to False.
+            reuse_digests (bool, optional): Trust unchanged file sizes and
+                modification times in the duplicate check. Defaults to False.
 
         Yields:
             ProgressInfo: Contains file progress on backup creation.
@@ -295,46 +600,90 @@ class Preset:
             FormatException: If the destination format is not supported.
             Backup: yields a backup of the target stored in the destination.
         """
+        content_hashes: dict[Path, str] = {}  # a target is only hashed once, however many destinations it has.
+        file_digests: dict[Path, dict] = {}
+        content_stats: dict[Path, tuple[int, int] | None] = {}  # None if the target is missing.
+        # each destination directory's backups grouped by target, so a directory is only
+        # listed once. destinations sharing a directory share its backups too.
+        backup_index: dict[Path, dict[Path, list[Backup]]] = {}
+        # each destination is only probed once, however many targets it has.
+        destinations_found = {
+            destination.path: destination.path.exists()
+            for destination in self._destinations
+        }
         for target, destination in product(self._targets, self._destinations):
-            if not target.exists():
+            if target not in content_stats:
+                try:
+                    content_stats[target] = get_content_stats(target)
+                except ValueError:
+                    content_stats[target] = None
+            if content_stats[target] is None:
                 yield TargetNotFoundException(
                     msg=target, target=target, destination=destination
                 )  # cannot raise exceptions or the generator dies. we'll raise them later.
                 continue
-            if not destination.path.exists():
+            if not destinations_found[destination.path]:
                 yield DestinationNotFoundException(
                     msg=destination.path, target=target, destination=destination
                 )
                 continue
-            md5_hash = None
-            for i in self.create_md5_hash(target):
-                if isinstance(i, ProgressInfo):
-                    yield i
-                elif isinstance(i, str):
-                    md5_hash = i
-            latest_backup = destination.get_latest_backup(target)
-            metafile_str = self._create_metafile(target, destination, md5_hash)
-            if not force and latest_backup is not None:
-                if latest_backup.content_hash == md5_hash:
+            content_size, file_count = content_stats[target]
+            if destination.path not in backup_index:
+                backups_by_target: dict[Path, list[Backup]] = {}
+                for backup in destination.get_backups():  # already sorted by date.
+                    backups_by_target.setdefault(backup.target, []).append(backup)
+                backup_index[destination.path] = backups_by_target
+            # shared by the duplicate check and the backup rotation.
+            target_backups = backup_index[destination.path].setdefault(target, [])
+            latest_backup = target_backups[-1] if target_backups else None
+            # if the size or file count changed the content did too, so it can't be a
+            # duplicate. neither can a backup whose hash was made another way be compared.
+            content_changed = latest_backup is not None and (
+                latest_backup.content_hash_scheme != CONTENT_HASH_SCHEME
+                or latest_backup.content_size not in (None, content_size)
+                or latest_backup.file_count not in (None, file_count)
+            )
+            # the content is only hashed up front when it's needed to check for a
+            # duplicate, otherwise each file is hashed as it's zipped.
+            if not force and latest_backup is not None and not content_changed:
+                if target not in content_hashes:
+                    # an unchanged size and mtime don't prove unchanged contents, so files
+                    # are all read again unless the caller opted into reusing digests.
+                    known_digests = latest_backup.get_file_digests() if reuse_digests else None
+                    for i in self.create_content_hash(target, known_digests):
+                        if isinstance(i, ProgressInfo):
+                            yield i
+                        elif isinstance(i, dict):
+                            file_digests[target] = i
+                        elif isinstance(i, str):
+                            content_hashes[target] = i
+                if latest_backup.content_hash == content_hashes[target]:
                     yield BackupHashException(
                         msg=latest_backup.path, target=target, destination=destination
                     )
                     continue
-            if target in destination.path.parents or target == destination.path:
+            if destination.path.is_relative_to(target):  # compares parts, no Path per parent.
                 # ensure destination cannot be contained inside a target path.
                 yield DestinationLoopException(msg="Destination is contained within the target.", 
                                                 target=target, destination=destination)
-            archive_name = (
-                target.stem
-                + destination.name_separator
-                + datetime.now().strftime(destination.date_format)
-            )
+            date_str = datetime.now().strftime(destination.date_format)
+            archive_name = target.stem + destination.name_separator + date_str
+            # parsed once here and stored, so listing the backup doesn't need strptime.
+            date = datetime.strptime(date_str, destination.date_format)
             try:
                 if (
                     destination.file_format == "zip"
                 ):  # allows us to support more formats later
                     for item in self._create_zip_archive(
-                        archive_name, target, destination, metafile_str
+                        archive_name,
+                        target,
+                        destination,
+                        content_hashes.get(target),
+                        content_size,
+                        file_count,
+                        file_digests.get(target),
+                        date,
+                        reuse_digests,
                     ):
                         if isinstance(
                             item, ProgressInfo
@@ -349,9 +698,17 @@ class Preset:
                         destination=destination,
                     )
                     continue
+                backup = Backup.from_file(archive_path)
+                if target not in content_hashes:  # hashed while zipping, the next destination reuses it.
+                    content_hashes[target] = backup.content_hash
+                    if reuse_digests:
+                        file_digests[target] = backup.get_file_digests()
                 if not keep:
-                    self._delete_old_backups(target, destination)
-                yield Backup.from_file(archive_path)
+                    target_backups.append(backup)
+                    self._delete_old_backups(target, destination, target_backups)
+                    # drop the deleted backups from the index too, same slice as _get_delete_candidates.
+                    del target_backups[:-destination.max_backup_count]
+                yield backup
             except KeyboardInterrupt:
                 archive_path.unlink()
                 yield BackupAbortedException(
@@ -379,14 +736,9 @@ class Preset:
             list[Backup]: The list of backups.
         """
         backups: list[Backup] = []
-        if target is None:
-            for preset_destination in self._destinations:
-                backups += preset_destination.get_backups()
-            backups.sort(key=lambda x: x.date)
-        else:
-            for preset_destination in self._destinations:
-                backups += preset_destination.get_backups(target)
-            backups.sort(key=lambda x: x.date)
+        for preset_destination in self._destinations:
+            backups += preset_destination.get_backups(target)
+        backups.sort(key=attrgetter("date"))
         return backups
 
     def get_latest_backup(
@@ -411,6 +763,7 @@ class Preset:
         self,
         target: Path,
         destination: Destination,
+        backups: list[Backup] = None,
     ) -> list[Backup]:
         """Internal method to get all viable delete candidates
         for an input target and destination.
@@ -425,17 +778,19 @@ class Preset:
             target (Path): The original source path the backups should be made.
             destination (Destination): The destination to get delete
                 candidates for.
+            backups (list[Backup], optional): The destination's backups of
+                the target, sorted by date in ascending order. Saves listing
+                the destination again if the caller already has them.
+                Defaults to None.
 
         Returns:
             list[Backup]: The list of candidates for deletion.
         """
-        target_backups: list[Backup] = []
-        for backup in destination.get_backups(target):
-            if backup.target == target:
-                target_backups.append(backup)
-        if len(target_backups) > destination.max_backup_count:
-            backup_count = len(target_backups) - destination.max_backup_count
-            return target_backups[:backup_count]
+        if backups is None:
+            backups = destination.get_backups(target)  # already filtered by target.
+        if len(backups) > destination.max_backup_count:
+            backup_count = len(backups) - destination.max_backup_count
+            return backups[:backup_count]
         else:
             return []
 
@@ -454,7 +809,9 @@ class Preset:
             delete_candidates += self._get_delete_candidates(target, destination)
         return delete_candidates
 
-    def _delete_old_backups(self, target: Path, destination: Destination):
+    def _delete_old_backups(
+        self, target: Path, destination: Destination, backups: list[Backup] = None
+    ):
         """Internal method to delete old backups for an input target and
         destination. Allows for backup rotation.
 
@@ -465,8 +822,11 @@ class Preset:
             target (Path): The target to delete old backups of.
             destination (Destination): The destination to search for backups
                 in.
+            backups (list[Backup], optional): The destination's backups of
+                the target, sorted by date in ascending order.
+                Defaults to None.
         """
-        for backup in self._get_delete_candidates(target, destination):
+        for backup in self._get_delete_candidates(target, destination, backups):
             backup.delete()
 
     def delete_old_backups(self) -> None:
@@ -524,15 +884,18 @@ schema = {
             "properties": {
                 "path": {"type": "string"},
                 "max_backup_count": {"type": "integer"},
-                "file_format": {"type": "string", "enum": VALID_FILE_FORMATS},
+                "file_format": {"type": "string", "enum": sorted(VALID_FILE_FORMATS)},
                 "date_format": {"type": "string"},
                 "name_separator": {"type": "string"},
+                "compresslevel": {"type": "integer", "minimum": 0, "maximum": 9},
             },
             "required": ["path"],
             "title": "Destination",
         },
     },
 }
+# built once, jsonschema.validate would check the schema and build a new validator on every call.
+_validator = Draft6Validator(schema)
 
 
 class PresetEncoder(json.JSONEncoder):
@@ -550,6 +913,7 @@ class PresetEncoder(json.JSONEncoder):
                 "file_format": o.file_format,
                 "date_format": o.date_format,
                 "name_separator": o.name_separator,
+                "compresslevel": o.compresslevel,
             }
         if isinstance(o, Path):
             return str(o)
@@ -558,24 +922,45 @@ class PresetEncoder(json.JSONEncoder):
 
 class PresetConfigFile:
     def __init__(self) -> None:
-        self._presets: dict[str, Preset] = {}
+        # presets stay as their parsed JSON until they're first used.
+        self._presets: dict[str, Preset | dict] = {}
 
     @property
     def presets(self):
-        return list(self._presets.values())
+        return [self[preset_name] for preset_name in self._presets]
+
+    @property
+    def preset_names(self) -> list[str]:
+        """The names of the loaded presets, read without building them."""
+        return list(self._presets)
 
     def save(self, preset: Preset):
         self._presets[preset.name] = preset
+        self._write()
+
+    def _write(self):
+        """Write the loaded presets back to the config file. Presets that
+        were never used are written back as they were read."""
         presets_dict = self._format_presets_dict(self._presets)
-        with self.config_file.open("w+") as fp:
-            print(json.dumps(presets_dict, cls=PresetEncoder))
-            json.dump(presets_dict, fp, cls=PresetEncoder)
+        # json.dumps goes through the C encoder, json.dump(fp) would stream through the Python one.
+        self.config_file.write_text(json.dumps(presets_dict, cls=PresetEncoder))
+
+    def verify_file(self, config_file: Path) -> dict:
+        """Load the config file and validate it against the schema.
 
-    def verify_file(self, config_file: Path):
+        Args:
+            config_file (Path): The config file to verify.
+
+        Raises:
+            ValueError: If the file is not valid JSON.
+            InvalidPresetConfig: If the JSON does not match the schema.
+
+        Returns:
+            dict: The parsed contents of the config file.
+        """
         try:  # validate the JSON against the schema
-            with config_file.open("r") as fp:
-                presets_data = json.load(fp)
-            validate(presets_data, schema=schema)
+            presets_data = json.loads(config_file.read_bytes())
+            _validator.validate(presets_data)
         except json.JSONDecodeError:
             raise ValueError(
                 "JSON file could not be decoded. Is the format correct?"
@@ -584,13 +969,14 @@ class PresetConfigFile:
             raise InvalidPresetConfig(
                 "JSON file does not match schema. Do you have all required values?"
             )
+        return presets_data
 
-    def _format_presets_dict(self, presets: dict[str, Preset]):
+    def _format_presets_dict(self, presets: dict[str, Preset | dict]):
         """Formats the given presets dictionary to the required format.
         Intended to use before dumping dictionary to file.
 
         Args:
-            presets (dict[str, Preset]): The dictionary to format.
+            presets (dict[str, Preset | dict]): The dictionary to format.
 
         Returns:
             dict: The new formatted dictionary.
@@ -599,29 +985,37 @@ class PresetConfigFile:
         return presets_dict
 
     def load(self, config_file: Path):
-        """Internal method to load presets from the config file into a
-        dictionary format.
+        """Internal method to load presets from the config file. Presets are
+        only built into Preset objects once they're requested, so loading a
+        config to use a single preset doesn't build all of them.
 
-        Returns:
-            dict[str, Preset]: The dictionary of Preset objects, with
-                the preset name as the key.
+        Args:
+            config_file (Path): The config file to load.
         """
-        self.verify_file(config_file)
+        presets_dict = self.verify_file(config_file)  # the file is only read and parsed once.
         self.config_file = config_file
-        self._presets = {}
-        with config_file.open("r") as fp:
-            presets_dict = json.load(fp)
-            self.format = presets_dict["format"]
-        for preset_name in presets_dict["presets"]:
-            preset_dict = presets_dict["presets"][preset_name]
-            preset = Preset(preset_name)
-            for target in preset_dict["targets"]:
-                preset.add_target(Path(target))
-            for destination in preset_dict["destinations"]:
-                destination = Destination.from_dict(destination)
-                preset.add_destination(destination)
-            self._presets[preset_name] = preset
-        return list(self._presets.values())
+        self.format = presets_dict["format"]
+        self._presets = dict(presets_dict["presets"])
+
+    def _build_preset(self, preset_name: str, preset_dict: dict) -> Preset:
+        """Build a Preset object from its config dictionary, replacing the
+        dictionary in the loaded presets.
+
+        Args:
+            preset_name (str): The name of the preset.
+            preset_dict (dict): The preset's config dictionary.
+
+        Returns:
+            Preset: The built preset.
+        """
+        preset = Preset(preset_name)
+        for target in preset_dict["targets"]:
+            preset.add_target(Path(target))
+        for destination in preset_dict["destinations"]:
+            destination = Destination.from_dict(destination)
+            preset.add_destination(destination)
+        self._presets[preset_name] = preset
+        return preset
 
     def delete_preset(self, preset: Preset) -> None:
         """Delete a preset from the preset config file.
@@ -637,15 +1031,16 @@ class PresetConfigFile:
             self._presets.pop(preset.name)
         except KeyError as e:
             raise PresetNotFoundException(preset.name) from e
-        presets_dict = self._format_presets_dict(self._presets)
-        with self.config_file.open("w+") as fp:
-            json.dump(presets_dict, fp, cls=PresetEncoder)
+        self._write()
 
     def __getitem__(self, key: str) -> Preset:
         try:
-            return self._presets[key]
+            preset = self._presets[key]
         except KeyError as e:
             raise PresetNotFoundException(key) from e
+        if isinstance(preset, dict):
+            preset = self._build_preset(key, preset)
+        return preset
 
 
 _preset_container = PresetConfigFile()
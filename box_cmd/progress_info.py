@@ -1,4 +1,6 @@
 class ProgressInfo:
+    __slots__ = ("count", "msg", "total")
+
     def __init__(self, count: int = 1, msg: str = None, total: int = None) -> None:
         """Used to communicate progress info from the Model to the View.
 
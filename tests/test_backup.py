@@ -1,4 +1,6 @@
-from box_cmd import Preset
+from pathlib import Path
+
+from box_cmd import Backup, Destination, Preset
 
 
 class TestBackup:
@@ -18,3 +20,23 @@ class TestBackup:
 \tdate: {backup.date}
 \tcontent_hash: {backup.content_hash}"""
             assert backup_str == correct_output
+
+    def test_backup_name_contains_separator(self, preset_json):
+        target = Path("temp/my-folder").absolute()
+        target.mkdir()
+        target.joinpath("file.txt").write_text("This is a test file. :)")
+        preset = Preset("separator")
+        preset.add_target(target)
+        preset.add_destination(Destination(Path("temp").absolute()))
+        backups = [item for item in preset.create_backups() if isinstance(item, Backup)]
+        assert len(backups) == 1
+        assert backups[0].name == "my-folder"
+        assert backups[0].target == target
+
+    def test_renamed_backup_keeps_date(self, preset_json):
+        Preset.load_file(preset_json)
+        preset = Preset.get_preset("testFolder")
+        backup = next(item for item in preset.create_backups() if isinstance(item, Backup))
+        renamed_path = backup.path.rename(backup.path.with_name("renamed.zip"))
+        renamed_backup = Backup.from_file(renamed_path)
+        assert renamed_backup.date == backup.date
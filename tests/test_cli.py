@@ -38,3 +38,15 @@ class TestCLI:
         runner = CliRunner()
         result = runner.invoke(cli, "--config temp/folder/sub_folder/file.txt presets")
         assert "The path exists, it doesn't seem to be a .json file though:" in result.output
+
+    def test_pack_cmd_skips_duplicate(self, preset_json):
+        runner = CliRunner()
+        runner.invoke(cli, "--config temp/presets.json pack testFile".split())
+        result = runner.invoke(cli, "--config temp/presets.json pack testFile".split())
+        assert "Backup Skipped:" in result.output
+        assert f"Target: {Path('temp/folder/sub_folder/file.txt').absolute()}" in result.output
+
+    def test_pack_cmd_preset_not_found(self, preset_json):
+        runner = CliRunner()
+        result = runner.invoke(cli, "--config temp/presets.json pack books".split())
+        assert "The requested preset 'books' is not found." in result.output
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 from box_cmd import Destination, Preset
 
 
@@ -38,3 +40,21 @@ class TestDestination:
                 for target in preset._targets:
                     for backup in destination.get_backups(target):
                         assert backup.target == target
+
+    def test_get_backups_missing_destination(self):
+        assert Destination(Path("temp/missing").absolute()).get_backups() == []
+
+    def test_str_subclass_settings(self):
+        class ConfigStr(str):
+            pass
+
+        destination = Destination(Path("temp"), name_separator=ConfigStr("-"))
+        assert destination.name_separator == "-"
+
+    def test_destination_hash(self):
+        destination = Destination(Path("temp"))
+        assert len({destination, Destination(Path("temp")), Destination(Path("other"))}) == 2
+
+    def test_compresslevel_out_of_range(self):
+        with pytest.raises(ValueError):
+            Destination(Path("temp"), compresslevel=10)
@@ -1,4 +1,5 @@
 from pathlib import Path
+import os
 import shutil
 import json
 
@@ -7,7 +8,7 @@ import pytest
 from box_cmd.preset import Preset
 from box_cmd.destination import Destination
 from box_cmd.backup import Backup
-from box_cmd.exceptions.exceptions import PresetNotFoundException, BackupHashException, BoxException, DestinationLoopException
+from box_cmd.exceptions.exceptions import PresetNotFoundException, BackupHashException, BoxException, DestinationLoopException, TargetNotFoundException
 from box_cmd.progress_info import ProgressInfo
 
 
@@ -27,6 +28,17 @@ class TestPreset:
         test_preset._destinations.append(destination)
         assert Preset.get_preset("testFolder") == test_preset
 
+    def test_get_preset_names(self, preset_json):
+        from box_cmd.preset import _preset_container
+
+        Preset.load_file(preset_json)
+        assert sorted(Preset.get_preset_names()) == ["testFile", "testFolder"]
+        assert not any(isinstance(preset, Preset) for preset in _preset_container._presets.values())
+
+    def test_preset_not_equal_to_other_types(self):
+        assert Preset("books") != "books"
+        assert Preset("books") != Preset("movies")
+
     def test_get_nonexistant_preset(self, preset_json):
         Preset.load_file(preset_json)
         with pytest.raises(PresetNotFoundException):
@@ -115,6 +127,15 @@ class TestPreset:
                         continue
                     raise exception
 
+    def test_create_backups_target_not_found(self, preset_json):
+        Preset.load_file(preset_json)
+        preset = Preset.get_preset("testFile")
+        preset._targets[0].unlink()
+        with pytest.raises(TargetNotFoundException):
+            for exception in preset.create_backups():
+                if isinstance(exception, BoxException):
+                    raise exception
+
     def test_create_backups_zip_no_force_no_keep(self, preset_json):
         Preset.load_file(preset_json)
         presets = Preset.get_presets()
@@ -196,23 +217,115 @@ class TestPreset:
         preset = Preset.get_preset("testFolder")
         target = preset._targets[0]
         destination = preset._destinations[0]
-        md5_hash = None
-        for i in preset.create_md5_hash(target):
+        content_hash = None
+        for i in preset.create_content_hash(target):
             if isinstance(i, ProgressInfo):
                 continue
             if isinstance(i, str):
-                md5_hash = i
-        metafile_str = preset._create_metafile(target, destination, md5_hash)
+                content_hash = i
+        metafile_str = preset._create_metafile(target, destination, content_hash)
 
         metafile_json = json.loads(metafile_str)
 
-        assert len(metafile_json.keys()) == 5
+        assert len(metafile_json.keys()) == 9
         assert metafile_json['target'] == str(target)
         assert metafile_json['name_separator'] == destination.name_separator
         assert metafile_json['date_format'] == destination.date_format
-        assert metafile_json['content_hash'] == md5_hash
+        assert metafile_json['content_hash'] == content_hash
         assert metafile_json['content_type'] == "folder"
 
+    def test_content_hash_matches_archive_hash(self, preset_json):
+        Preset.load_file(preset_json)
+        preset = Preset.get_preset("testFolder")
+        target = preset._targets[0]
+        target.joinpath("large.bin").write_bytes(bytes(range(256)) * 8192)  # spans several read chunks
+        content_hash = None
+        for i in preset.create_content_hash(target):
+            if isinstance(i, str):
+                content_hash = i
+        for backup in preset.create_backups(force=True):  # hashed while zipping
+            if isinstance(backup, Backup):
+                assert backup.content_hash == content_hash
+
+    def test_content_hash_reuses_file_digests(self, preset_json, monkeypatch):
+        Preset.load_file(preset_json)
+        preset = Preset.get_preset("testFolder")
+        file = preset._targets[0].joinpath("sub_folder", "file.txt")
+        os.utime(file, (946684800, 946684800))  # old enough for its cached digest to be trusted.
+        for _ in preset.create_backups(reuse_digests=True):
+            continue
+
+        def hash_files(paths):
+            raise AssertionError(f"{paths} should not be hashed again")
+        monkeypatch.setattr("box_cmd.preset.hash_files", hash_files)
+        progress = 0
+        with pytest.raises(BackupHashException):
+            for exception in preset.create_backups(reuse_digests=True):
+                if isinstance(exception, ProgressInfo):
+                    progress += exception.count
+                    if exception.total is not None:  # the CLI's progress bar resets here.
+                        progress = 0
+                if isinstance(exception, BoxException):
+                    raise exception
+        assert progress == 1  # the cached file still counts as checked.
+
+    def test_file_digests_only_stored_on_request(self, preset_json):
+        Preset.load_file(preset_json)
+        preset = Preset.get_preset("testFolder")
+        backup = next(item for item in preset.create_backups() if isinstance(item, Backup))
+        assert backup.get_file_digests() is None
+
+    def test_same_size_change_is_not_a_duplicate(self, preset_json):
+        Preset.load_file(preset_json)
+        preset = Preset.get_preset("testFolder")
+        file = preset._targets[0].joinpath("sub_folder", "file.txt")
+        os.utime(file, (946684800, 946684800))
+        for _ in preset.create_backups():
+            continue
+        file.write_text(file.read_text().upper())  # same size, different contents.
+        os.utime(file, (946684800, 946684800))
+        backups = [item for item in preset.create_backups() if isinstance(item, Backup)]
+        assert len(backups) == 1
+
+    def test_renamed_file_is_not_a_duplicate(self, preset_json):
+        Preset.load_file(preset_json)
+        preset = Preset.get_preset("testFolder")
+        for _ in preset.create_backups():
+            continue
+        sub_folder = preset._targets[0].joinpath("sub_folder")
+        sub_folder.joinpath("file.txt").rename(sub_folder.joinpath("renamed.txt"))
+        backups = [item for item in preset.create_backups() if isinstance(item, Backup)]
+        assert len(backups) == 1
+
+    def test_create_backups_lists_destination_once(self, preset_json, monkeypatch):
+        Preset.load_file(preset_json)
+        preset = Preset("twoTargets")
+        preset.add_target(Path("temp/folder").absolute())
+        preset.add_target(Path("temp/folder/sub_folder/file.txt").absolute())
+        preset.add_destination(Destination(Path("temp").absolute()))
+        listed = []
+        get_backups = Destination.get_backups
+        monkeypatch.setattr(
+            Destination, "get_backups",
+            lambda self, target=None: listed.append(target) or get_backups(self, target)
+        )
+        backups = [item for item in preset.create_backups() if isinstance(item, Backup)]
+        assert len(backups) == 2
+        assert listed == [None]
+
+    def test_create_backups_destinations_share_directory(self, preset_json):
+        Preset.load_file(preset_json)
+        preset = Preset("twoTargets")
+        preset.add_target(Path("temp/folder").absolute())
+        preset.add_target(Path("temp/folder/sub_folder/file.txt").absolute())
+        preset.add_destination(Destination(Path("temp").absolute(), max_backup_count=1, compresslevel=1))
+        preset.add_destination(Destination(Path("temp").absolute(), max_backup_count=1, compresslevel=9))
+        results = list(preset.create_backups())
+        assert len([item for item in results if isinstance(item, Backup)]) == 2
+        assert len([item for item in results if isinstance(item, BackupHashException)]) == 2
+        assert len(list(Path("temp").glob("folder*.zip"))) == 1
+        assert len(list(Path("temp").glob("file*.zip"))) == 1
+
     def test_restore_backup(self, preset_json):
         Preset.load_file(preset_json)
 